@@ -1,17 +1,74 @@
+import io
 import csv
 import json
 import sys
 import os
 import re
 import argparse
+import shutil
+import functools
+import itertools
+import collections
+from concurrent.futures import ProcessPoolExecutor
 try:
-    from jsonschema import validate, ValidationError, Draft7Validator
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
     print("Warning: jsonschema library not found. Advanced schema validation will not be available.")
     print("To install: pip install jsonschema")
 
+# Use orjson for parsing cells when it is installed. orjson parses a str from
+# its cached UTF-8 buffer, so cells are passed as str rather than re-read from
+# the file as bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson turns integers wider than 64 bits into floats; such cells go to json
+_RE_LONG_DIGITS = re.compile(r'\d{19}')
+
+def json_loads(json_str):
+    """
+    Parse JSON, accepting exactly what json.loads accepts
+    orjson is only a fast path: anything it rejects (NaN, Infinity, 1e999,
+    lone surrogates) or may read differently (very long integers) is parsed
+    by json.loads, so results and error messages do not depend on orjson
+    """
+    if ORJSON_AVAILABLE and not _RE_LONG_DIGITS.search(json_str):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
+
+# Precompiled patterns used by fix_json_string
+_RE_KEY_QUOTE = re.compile(r'([{,])\s*([a-zA-Z0-9_]+)\s*:')
+_RE_MISSING_COMMA = re.compile(r'(["}\d])\s*(["{\w])')
+_RE_TRAIL_COMMA = re.compile(r',\s*([}\]])')
+
+# Buffer size for reading the input CSV and writing the fixed copy
+IO_BUFFER_SIZE = 1 << 20
+
+# Number of rows read and checked as one batch
+ROWS_PER_CHUNK = 1_000
+
+# Largest byte range of the file handed to one worker with --jobs
+BYTES_PER_RANGE = 4 << 20
+
+# Number of distinct cell results remembered per schema, and the longest
+# cell that is cached. Repeated cells are typically short enum-like or
+# config payloads; long cells are rarely repeated and would cost the most memory
+CELL_CACHE_SIZE = 10_000
+CELL_CACHE_MAX_LENGTH = 256
+
+# Number of fix attempts remembered, shared by all schemas. Only cells up
+# to CELL_CACHE_MAX_LENGTH are cached here too.
+FIX_CACHE_SIZE = 10_000
+
 def fix_json_string(json_str):
     """
     Attempt to fix common JSON formatting issues
@@ -20,18 +77,18 @@ def fix_json_string(json_str):
     fixed_str = json_str.replace("'", "\"")
     
     # Add quotes to keys that are missing them
-    fixed_str = re.sub(r'([{,])\s*([a-zA-Z0-9_]+)\s*:', r'\1"\2":', fixed_str)
+    fixed_str = _RE_KEY_QUOTE.sub(r'\1"\2":', fixed_str)
     
     # Fix missing commas between key-value pairs
     # Look for patterns like "key1":"value1""key2":"value2" or "key1":value1"key2":value2
-    fixed_str = re.sub(r'(["}\d])\s*(["{\w])', r'\1,\2', fixed_str)
+    fixed_str = _RE_MISSING_COMMA.sub(r'\1,\2', fixed_str)
     
     # Try to fix trailing commas in arrays and objects
-    fixed_str = re.sub(r',\s*}', '}', fixed_str)
-    fixed_str = re.sub(r',\s*]', ']', fixed_str)
+    fixed_str = _RE_TRAIL_COMMA.sub(r'\1', fixed_str)
     
     return fixed_str
 
+@functools.lru_cache(maxsize=None)
 def get_column_letter(index):
     """
     Convert column index to letter (0 = A, 1 = B, etc.)
@@ -46,192 +103,641 @@ def get_column_letter(index):
         index -= 1
     return result
 
-def validate_json_schema(json_obj, schema=None):
+def build_validator(schema):
+    """
+    Check a schema once and build a reusable validator for it
+    The validator class follows the schema's $schema, as jsonschema.validate does
+    Raises SchemaError if the schema itself is invalid
+    """
+    if not JSONSCHEMA_AVAILABLE or schema is None:
+        return None
+    
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+def _try_fix(cell):
+    """
+    Fix a cell with fix_json_string and check that the result parses
+    Returns (fixed_json_str, None), or (None, error_message) if the fixed
+    string still does not parse
+    """
+    if len(cell) <= CELL_CACHE_MAX_LENGTH:
+        return _try_fix_cached(cell)
+    return _try_fix_uncached(cell)
+
+def _try_fix_uncached(cell):
+    fixed_json_str = fix_json_string(cell)
+    try:
+        json_loads(fixed_json_str)
+    except json.JSONDecodeError as e:
+        return None, str(e)
+    return fixed_json_str, None
+
+_try_fix_cached = functools.lru_cache(maxsize=FIX_CACHE_SIZE)(_try_fix_uncached)
+
+# Outcome of checking one cell; see _check_cell
+CellResult = collections.namedtuple("CellResult", [
+    "parse_error",         # str(JSONDecodeError) if the cell is not valid JSON, else None
+    "error_type",          # Summary category of parse_error
+    "schema_error",        # Best-match schema error message for the parsed cell
+    "schema_error_details",  # (message, path) of every schema error, when logging details
+    "fixed_json",          # Fixed cell text if the fix parsed, else None
+    "fix_error",           # str(JSONDecodeError) if the fix did not parse
+    "fixed_schema_error",  # Best-match schema error message for the fixed cell
+])
+
+def _check_cell(cell, validator, summary_only):
+    """
+    Parse, validate and if needed fix one cell
+    Returns a CellResult, which only depends on the arguments so it can be cached
+    """
+    try:
+        # Try to parse as JSON
+        json_obj = json_loads(cell)
+    except json.JSONDecodeError as e:
+        error_msg = str(e)
+        # The bare message, without the position suffix str(e) adds
+        error_type = e.msg
+        
+        # Try to fix the JSON
+        fixed_json_str, fix_error = _try_fix(cell)
+        if fixed_json_str is None:
+            return CellResult(error_msg, error_type, None, (), None, fix_error, None)
+        
+        # Validate fixed JSON against schema
+        fixed_schema_error = None
+        if validator is not None:
+            error = best_match(validator.iter_errors(json_loads(fixed_json_str)))
+            if error is not None:
+                fixed_schema_error = error.message
+        return CellResult(error_msg, error_type, None, (), fixed_json_str, None, fixed_schema_error)
+    
+    # Validate against schema if available
+    schema_error = None
+    schema_error_details = ()
+    if validator is not None:
+        # One pass over the instance gives both the summary and the details
+        errors = list(validator.iter_errors(json_obj))
+        if errors:
+            schema_error = best_match(errors).message
+            if not summary_only:
+                schema_error_details = tuple(
+                    (err.message, '.'.join(str(p) for p in err.path))
+                    for err in errors
+                )
+    return CellResult(None, None, schema_error, schema_error_details, None, None, None)
+
+def _make_config(default_validator, column_validators, summary_only, include_scalars):
+    """
+    Bundle the per-run settings needed to check a row
+    Each validator gets its own cache of cell results, so repeated short
+    cells in a column are only parsed and validated once
+    """
+    def cached_checker(validator):
+        check = functools.partial(_check_cell, validator=validator, summary_only=summary_only)
+        cached_check = functools.lru_cache(maxsize=CELL_CACHE_SIZE)(check)
+        
+        def check_cell(cell):
+            if len(cell) <= CELL_CACHE_MAX_LENGTH:
+                return cached_check(cell)
+            return check(cell)
+        return check_cell
+    
+    return {
+        "default_checker": cached_checker(default_validator),
+        "column_checkers": {col_idx: cached_checker(validator)
+                            for col_idx, validator in column_validators.items()},
+        "summary_only": summary_only,
+        "include_scalars": include_scalars,
+    }
+
+def _new_stats():
+    """
+    Create a fresh set of counters for the summary
+    """
+    return {
+        "cells_checked": 0,
+        "json_cells": 0,
+        "errors": 0,
+        "fixed_errors": 0,
+        "unfixed_errors": 0,
+        "schema_errors": 0,
+        "error_types": collections.Counter(),
+    }
+
+def _merge_stats(total, stats):
+    """
+    Add the counters in stats to total
+    """
+    for key, value in stats.items():
+        if key == "error_types":
+            total["error_types"].update(value)
+        else:
+            total[key] += value
+
+def _process_row(row, row_num, config, stats, log):
     """
-    Validate JSON object against a schema
-    Returns (is_valid, error_message)
+    Check and fix the JSON cells of one row
+    Updates stats, appends (row_num, message) pairs to log and returns the fixed
+    row, which is row itself if nothing was fixed
     """
-    if not JSONSCHEMA_AVAILABLE:
-        return True, "Schema validation skipped (jsonschema not installed)"
+    default_checker = config["default_checker"]
+    column_checkers = config["column_checkers"]
+    summary_only = config["summary_only"]
+    include_scalars = config["include_scalars"]
+    
+    # A row with no { or [ anywhere cannot hold an object or array, so one
+    # scan of the joined row replaces the per-cell checks below
+    if not include_scalars:
+        joined = "".join(row)
+        if "{" not in joined and "[" not in joined:
+            stats["cells_checked"] += len(row)
+            return row
+    
+    fixed_row = row
     
-    if schema is None:
-        return True, "No schema provided for validation"
+    # Check all columns
+    for col_idx in range(0, len(row)):
+        cell = row[col_idx]
+        stats["cells_checked"] += 1
+        
+        # Skip empty cells
+        if not cell or cell.isspace():
+            continue
+        
+        # Only cells that look like an object or array are treated as
+        # JSON, unless scalar values were asked for
+        if not include_scalars:
+            first_char = cell[0]
+            if first_char.isspace():
+                first_char = cell.lstrip()[0]
+            if first_char not in "{[":
+                continue
+        
+        # Determine which schema to check this column with
+        check_cell = column_checkers.get(col_idx, default_checker)
+        result = check_cell(cell)
+        if result.parse_error is None:
+            stats["json_cells"] += 1
+            if result.schema_error is not None:
+                stats["schema_errors"] += 1
+                if not summary_only:
+                    col_letter = get_column_letter(col_idx)
+                    log.append((row_num, f"Column {col_letter}: Schema validation error: {result.schema_error}"))
+                    for message, path in result.schema_error_details:
+                        log.append((None, f"  - {message} at {path}"))
+            continue
+        
+        stats["errors"] += 1
+        stats["error_types"][result.error_type] += 1
+        if not summary_only:
+            col_letter = get_column_letter(col_idx)
+            log.append((row_num, f"Column {col_letter}: JSON format is incorrect - {result.parse_error}"))
+        
+        if result.fixed_json is not None:
+            stats["fixed_errors"] += 1
+            if not summary_only:
+                col_letter = get_column_letter(col_idx)
+                log.append((row_num, f"Column {col_letter}: JSON fixed successfully"))
+            if result.fixed_schema_error is not None and not summary_only:
+                stats["schema_errors"] += 1
+                col_letter = get_column_letter(col_idx)
+                log.append((row_num, f"Column {col_letter}: Fixed JSON fails schema validation - "
+                                     f"Schema validation error: {result.fixed_schema_error}"))
+            if fixed_row is row:
+                fixed_row = row.copy()
+            fixed_row[col_idx] = result.fixed_json
+        else:
+            stats["unfixed_errors"] += 1
+            if not summary_only:
+                col_letter = get_column_letter(col_idx)
+                log.append((row_num, f"Column {col_letter}: Could not fix JSON - {result.fix_error}"))
     
+    return fixed_row
+
+def _process_chunk(records, first_row_num, config):
+    """
+    Check and fix a batch of consecutive (row, raw) records from _read_records
+    Returns (output, stats, log) where output is the bytes to write for the batch.
+    Unchanged rows are copied as they were in the input; only fixed rows are
+    re-serialized, using the same line ending as the original record.
+    """
+    stats = _new_stats()
+    log = []
+    output = []
+    row_buffer = io.StringIO()
+    # The writer's own \r\n is dropped below; it must stay the line terminator
+    # so that cells containing \r or \n are still quoted
+    writer = csv.writer(row_buffer)
+    for row_num, (row, raw) in enumerate(records, first_row_num):
+        fixed_row = _process_row(row, row_num, config, stats, log)
+        if fixed_row is row:
+            output.append(raw)
+            continue
+        
+        row_buffer.seek(0)
+        row_buffer.truncate()
+        writer.writerow(fixed_row)
+        output.append(row_buffer.getvalue()[:-2].encode('utf-8'))
+        if raw.endswith(b"\r\n"):
+            output.append(b"\r\n")
+        elif raw.endswith(b"\n"):
+            output.append(b"\n")
+        elif raw.endswith(b"\r"):
+            output.append(b"\r")
+    return b"".join(output), stats, log
+
+def _iter_raw_lines(f, start=0, end=None):
+    """
+    Yield the lines of a binary file from start up to end
+    Lines end at \r\n, \n or a lone \r, the same split as text mode with newline=''
+    """
+    f.seek(start)
+    pos = start
+    pending = b""
+    while end is None or pos < end:
+        block = f.read(IO_BUFFER_SIZE if end is None else min(IO_BUFFER_SIZE, end - pos))
+        if not block:
+            break
+        pos += len(block)
+        lines = (pending + block).splitlines(keepends=True)
+        # The last line may be incomplete, or end in a \r whose \n is in the next block
+        pending = b"" if lines[-1].endswith(b"\n") else lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+def _decode_line(line, offset, f):
+    """
+    Decode a line read from f at byte offset, reporting undecodable bytes
+    by their position in the file rather than in the line
+    """
     try:
-        validate(instance=json_obj, schema=schema)
-        return True, "JSON is valid according to schema"
-    except ValidationError as e:
-        return False, f"Schema validation error: {e.message}"
+        return line.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise UnicodeDecodeError(e.encoding, e.object, e.start, e.end,
+                                 f"{e.reason} (byte offset {offset + e.start} in {f.name})") from None
 
-def get_all_validation_errors(json_obj, schema):
+class RangeNotAlignedError(Exception):
     """
-    Get all validation errors for a JSON object against a schema
+    A byte range given to _read_records did not end on a record boundary
     """
-    if not JSONSCHEMA_AVAILABLE:
-        return []
+
+def _read_records(f, start=0, end=None):
+    """
+    Parse CSV records from a binary file from a record boundary at start
+    Yields (row, raw) where raw is the record's bytes exactly as in the file.
+    If end is given, raises RangeNotAlignedError when the last record read
+    does not finish at end, i.e. end falls inside a quoted field.
+    """
+    raw_lines = []
+    at_end = False
+    
+    def decoded_lines():
+        nonlocal at_end
+        offset = start
+        for line in _iter_raw_lines(f, start, end):
+            raw_lines.append(line)
+            yield _decode_line(line, offset, f)
+            offset += len(line)
+        if end is not None:
+            # An empty line reads as an empty row only outside a quoted
+            # field; inside one csv.reader takes it as part of the field
+            at_end = True
+            yield ""
     
-    validator = Draft7Validator(schema)
-    return list(validator.iter_errors(json_obj))
+    # csv.reader only pulls the lines of one record before yielding it
+    for row in csv.reader(decoded_lines()):
+        if at_end:
+            if raw_lines:
+                raise RangeNotAlignedError(f"byte {end} of {f.name} is not on a record boundary")
+            return
+        yield row, b"".join(raw_lines)
+        raw_lines.clear()
+
+def _read_chunks(records, first_row_num):
+    """
+    Yield (records, first_row_num) batches of up to ROWS_PER_CHUNK records
+    """
+    while True:
+        chunk = list(itertools.islice(records, ROWS_PER_CHUNK))
+        if not chunk:
+            return
+        yield chunk, first_row_num
+        first_row_num += len(chunk)
+
+# Settings for the rows checked in a worker process, set up by _init_worker
+_worker_config = None
+
+def _init_worker(schema, column_specific_schemas, summary_only, include_scalars):
+    """
+    Build the validators once per worker process
+    """
+    global _worker_config
+    column_validators = {col_idx: build_validator(col_schema)
+                         for col_idx, col_schema in column_specific_schemas.items()}
+    _worker_config = _make_config(build_validator(schema), column_validators, summary_only, include_scalars)
 
-def check_and_fix_json_in_csv(filename, schema_file=None, column_schemas=None, summary_only=False):
+def _format_log(log, row_offset=0):
+    """
+    Turn (row_num, message) log entries into output text
+    Entries without a row number are detail lines and are printed as is
+    """
+    lines = []
+    for row_num, message in log:
+        if row_num is None:
+            lines.append(message)
+        else:
+            lines.append(f"Row {row_num + row_offset}, {message}")
+    return "\n".join(lines) + "\n"
+
+def _read_record_lines(f, start, quotes=0):
+    """
+    Read lines from a binary file from start until the end of a CSV record
+    A record ends at the first line end that is not inside a quoted field,
+    i.e. once the number of quote characters read is even. quotes is the
+    count already seen before start.
+    Returns (lines, quotes); lines is empty at end of file
+    """
+    lines = []
+    for line in _iter_raw_lines(f, start):
+        lines.append(line)
+        quotes += line.count(b'"')
+        if quotes % 2 == 0:
+            break
+    return lines, quotes
+
+def _read_header(filename):
+    """
+    Read the header record of a CSV file
+    Returns (header, raw) where raw is the header's bytes as in the file
+    """
+    with open(filename, 'rb') as f:
+        first_record = next(_read_records(f), None)
+    if first_record is None:
+        return None, b""
+    return first_record
+
+def _split_byte_ranges(filename, start, range_size):
+    """
+    Yield consecutive (start, end) byte ranges of about range_size bytes
+    covering filename[start:]
+    Ranges end where the quotes counted so far are balanced, which keeps
+    quoted fields containing newlines whole. A quote character inside an
+    unquoted field (which RFC 4180 does not allow) throws this count off,
+    so _read_records checks each boundary when the range is parsed.
+    """
+    size = os.path.getsize(filename)
+    with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        pos = start
+        quotes = 0
+        while pos < size:
+            range_start = pos
+            target = min(pos + range_size, size)
+            
+            # Count quotes up to the target to know whether it is inside a quoted field
+            f.seek(pos)
+            while pos < target:
+                block = f.read(min(IO_BUFFER_SIZE, target - pos))
+                pos += len(block)
+                quotes += block.count(b'"')
+            
+            # Move on to the end of the record the target falls in. A target
+            # between the \r and \n of a line end gives a lone "\n" line here,
+            # which is still a valid place to split.
+            if pos < size:
+                lines, quotes = _read_record_lines(f, pos, quotes)
+                pos += sum(len(line) for line in lines)
+            yield range_start, pos
+
+def _process_byte_range(filename, start, end, part_filename):
+    """
+    Worker process entry point: check the records in filename[start:end]
+    end is None for the last range. Output is written to part_filename.
+    Returns (row_count, stats, log) with log row numbers counted from the
+    start of the range; raises RangeNotAlignedError if end is not a record
+    boundary.
+    """
+    stats = _new_stats()
+    log = []
+    row_count = 0
+    with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as infile, \
+            open(part_filename, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+        for records, first_row_num in _read_chunks(_read_records(infile, start, end), 1):
+            output, chunk_stats, chunk_log = _process_chunk(records, first_row_num, _worker_config)
+            outfile.write(output)
+            _merge_stats(stats, chunk_stats)
+            log.extend(chunk_log)
+            row_count += len(records)
+    return row_count, stats, log
+
+def _check_records(records, first_row_num, config, outfile, stats):
+    """
+    Check records in this process, writing them to outfile and their log to stdout
+    """
+    # Each chunk's log is written with a single call rather than a print per line
+    for chunk, first_row_num in _read_chunks(records, first_row_num):
+        output, chunk_stats, log = _process_chunk(chunk, first_row_num, config)
+        if log:
+            sys.stdout.write(_format_log(log))
+        outfile.write(output)
+        _merge_stats(stats, chunk_stats)
+
+def _check_file(filename, output_filename, config, stats):
+    """
+    Check a CSV file in this process, streaming the output to output_filename
+    """
+    with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as infile, \
+            open(output_filename, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+        records = _read_records(infile)
+        # Read header if exists
+        header = None
+        first_record = next(records, None)
+        if first_record is not None:
+            header, header_raw = first_record
+            outfile.write(header_raw)
+        
+        _check_records(records, 2 if header else 1, config, outfile, stats)
+
+def _write_range_result(result, part_filename, outfile, row_offset, stats):
+    """
+    Print a finished range's log, append its part file to outfile and
+    merge its stats. Returns the row offset for the next range.
+    """
+    row_count, range_stats, log = result
+    if log:
+        sys.stdout.write(_format_log(log, row_offset))
+    with open(part_filename, 'rb') as part:
+        shutil.copyfileobj(part, outfile, IO_BUFFER_SIZE)
+    os.remove(part_filename)
+    _merge_stats(stats, range_stats)
+    return row_offset + row_count
+
+def _check_file_in_parallel(filename, output_filename, jobs, worker_args, config, stats):
+    """
+    Check a CSV file by splitting it into byte ranges checked by worker processes
+    Each worker reads its own range and writes its own part file; the parts
+    are appended to output_filename in order and their logs renumbered.
+    Ranges are at most BYTES_PER_RANGE and only a few per worker are in
+    flight, so output starts early and memory use stays bounded.
+    If a range turns out not to end on a record boundary, the rest of the
+    file from that range on is checked in this process with config.
+    """
+    header, header_raw = _read_header(filename)
+    with open(output_filename, 'wb') as outfile:
+        outfile.write(header_raw)
+    
+    size = os.path.getsize(filename)
+    data_size = size - len(header_raw)
+    range_size = max(1, min(BYTES_PER_RANGE, -(-data_size // jobs)))
+    row_offset = 1 if header else 0
+    serial_start = None
+    pending = collections.deque()
+    
+    def write_next_range():
+        # A range leaves pending only once written, so a failed range's part
+        # file is still cleaned up below. Returns the range's start if it
+        # has to be checked again in this process.
+        nonlocal row_offset
+        start, future, part_filename = pending[0]
+        try:
+            result = future.result()
+        except RangeNotAlignedError:
+            return start
+        row_offset = _write_range_result(result, part_filename, outfile, row_offset, stats)
+        pending.popleft()
+        return None
+    
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=worker_args) as executor, \
+                open(output_filename, 'ab') as outfile:
+            ranges = _split_byte_ranges(filename, len(header_raw), range_size)
+            for i, (start, end) in enumerate(ranges):
+                part_filename = f"{output_filename}.part{i:04d}"
+                # The last range may end inside a quoted field, as a serial run allows
+                future = executor.submit(_process_byte_range, filename, start,
+                                         end if end < size else None, part_filename)
+                pending.append((start, future, part_filename))
+                if len(pending) >= jobs * 2:
+                    serial_start = write_next_range()
+                    if serial_start is not None:
+                        break
+            
+            # Results are taken in submission order, so rows and logs stay in order
+            while pending and serial_start is None:
+                serial_start = write_next_range()
+            
+            # Stop whatever has not started yet before the pool shuts down
+            for start, future, part_filename in pending:
+                future.cancel()
+    finally:
+        for start, future, part_filename in pending:
+            future.cancel()
+        for start, future, part_filename in pending:
+            if os.path.exists(part_filename):
+                os.remove(part_filename)
+    
+    # Every range before serial_start ended on a record boundary, so it is one too
+    if serial_start is not None:
+        with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as infile, \
+                open(output_filename, 'ab', buffering=IO_BUFFER_SIZE) as outfile:
+            _check_records(_read_records(infile, serial_start), row_offset + 1, config, outfile, stats)
+
+def check_and_fix_json_in_csv(filename, schema_file=None, column_schemas=None, summary_only=False,
+                              include_scalars=False, jobs=1):
     """
     Check and fix JSON in CSV cells
     
     Args:
         filename: CSV file to check
         schema_file: Optional JSON schema file for validation
-        column_schemas: Optional dict mapping column indices to schema files
+        column_schemas: Optional dict mapping column indices (int or str) to schema files
         summary_only: If True, only show summary statistics, not detailed logs
+        include_scalars: If True, also check cells that do not start with { or [
+                         (numbers, strings, booleans) as JSON
+        jobs: Number of worker processes to split the file between (1 = no workers)
     """
     temp_filename = filename + ".temp"
-    fixed_rows = []
-    has_fixes = False
+    # Output is written here first and only renamed to temp_filename if
+    # there were fixes, so a failed or fix-free run leaves an existing
+    # temp file from an earlier run alone
+    partial_filename = temp_filename + ".partial"
     
     # Load schema if provided
     schema = None
+    default_validator = None
     if schema_file and JSONSCHEMA_AVAILABLE:
         try:
             with open(schema_file, 'r', encoding='utf-8') as f:
                 schema = json.load(f)
+            default_validator = build_validator(schema)
             if not summary_only:
                 print(f"Loaded schema from {schema_file}")
         except Exception as e:
             print(f"Error loading schema file: {e}")
     
-    # Load column-specific schemas if provided
+    # Load column-specific schemas if provided, keyed by integer column index
     column_specific_schemas = {}
+    column_validators = {}
     if column_schemas and JSONSCHEMA_AVAILABLE:
         for col_idx, schema_path in column_schemas.items():
+            col_name = col_idx
             try:
+                col_idx = int(col_idx)
+                col_name = get_column_letter(col_idx)
                 with open(schema_path, 'r', encoding='utf-8') as f:
                     column_specific_schemas[col_idx] = json.load(f)
+                column_validators[col_idx] = build_validator(column_specific_schemas[col_idx])
                 if not summary_only:
-                    print(f"Loaded schema for column {get_column_letter(int(col_idx))} from {schema_path}")
+                    print(f"Loaded schema for column {col_name} from {schema_path}")
             except Exception as e:
-                print(f"Error loading schema for column {get_column_letter(int(col_idx))}: {e}")
+                print(f"Error loading schema for column {col_name}: {e}")
     
-    # Statistics
-    total_cells_checked = 0
-    total_json_cells = 0
-    total_errors = 0
-    fixed_errors = 0
-    unfixed_errors = 0
-    schema_errors = 0
-    error_types = {}
+    # Schemas (not validators, which cannot be pickled) are what worker
+    # processes need to rebuild the same validators
+    worker_args = (
+        schema if default_validator is not None else None,
+        {col_idx: column_specific_schemas[col_idx] for col_idx in column_validators},
+        summary_only,
+        include_scalars,
+    )
+    stats = _new_stats()
     
-    with open(filename, newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        # Read header if exists
-        header = next(reader, None)
-        fixed_rows.append(header)
-        
-        row_num = 1 if header else 0
-        for row in reader:
-            row_num += 1
-            fixed_row = row.copy()
-            
-            # Skip if row is empty
-            if not row:
-                fixed_rows.append(row)
-                continue
-                
-            # Check all columns
-            for col_idx in range(0, len(row)):
-                cell = row[col_idx]
-                total_cells_checked += 1
-                
-                # Skip empty cells
-                if cell.strip() == "":
-                    continue
-                
-                # Determine which schema to use for this column
-                current_schema = None
-                if str(col_idx) in column_specific_schemas:
-                    current_schema = column_specific_schemas[str(col_idx)]
-                elif col_idx in column_specific_schemas:
-                    current_schema = column_specific_schemas[col_idx]
-                else:
-                    current_schema = schema
-                    
-                try:
-                    # Try to parse as JSON
-                    json_obj = json.loads(cell)
-                    total_json_cells += 1
-                    
-                    # Validate against schema if available
-                    if current_schema and JSONSCHEMA_AVAILABLE:
-                        is_valid, error_msg = validate_json_schema(json_obj, current_schema)
-                        if not is_valid:
-                            schema_errors += 1
-                            if not summary_only:
-                                col_letter = get_column_letter(col_idx)
-                                print(f"Row {row_num}, Column {col_letter}: {error_msg}")
-                                
-                                # Get all validation errors
-                                all_errors = get_all_validation_errors(json_obj, current_schema)
-                                for err in all_errors:
-                                    print(f"  - {err.message} at {'.'.join(str(p) for p in err.path)}")
-                        
-                except json.JSONDecodeError as e:
-                    total_errors += 1
-                    error_msg = str(e)
-                    error_type = error_msg.split(':')[0] if ':' in error_msg else error_msg
-                    error_types[error_type] = error_types.get(error_type, 0) + 1
-                    
-                    if not summary_only:
-                        col_letter = get_column_letter(col_idx)
-                        print(f"Row {row_num}, Column {col_letter}: JSON format is incorrect - {e}")
-                    
-                    # Try to fix the JSON
-                    fixed_json_str = fix_json_string(cell)
-                    try:
-                        json_obj = json.loads(fixed_json_str)
-                        fixed_errors += 1
-                        if not summary_only:
-                            col_letter = get_column_letter(col_idx)
-                            print(f"Row {row_num}, Column {col_letter}: JSON fixed successfully")
-                        
-                        # Validate fixed JSON against schema
-                        if current_schema and JSONSCHEMA_AVAILABLE:
-                            is_valid, error_msg = validate_json_schema(json_obj, current_schema)
-                            if not is_valid and not summary_only:
-                                schema_errors += 1
-                                col_letter = get_column_letter(col_idx)
-                                print(f"Row {row_num}, Column {col_letter}: Fixed JSON fails schema validation - {error_msg}")
-                        
-                        fixed_row[col_idx] = fixed_json_str
-                        has_fixes = True
-                    except json.JSONDecodeError as e2:
-                        unfixed_errors += 1
-                        if not summary_only:
-                            col_letter = get_column_letter(col_idx)
-                            print(f"Row {row_num}, Column {col_letter}: Could not fix JSON - {e2}")
-            
-            fixed_rows.append(fixed_row)
+    # Rows are streamed to the partial file as they are checked; it is
+    # removed again if the run fails or nothing needed fixing
+    config = _make_config(default_validator, column_validators, summary_only, include_scalars)
+    try:
+        if jobs > 1:
+            _check_file_in_parallel(filename, partial_filename, jobs, worker_args, config, stats)
+        else:
+            _check_file(filename, partial_filename, config, stats)
+    except BaseException:
+        if os.path.exists(partial_filename):
+            os.remove(partial_filename)
+        raise
     
-    # Write the fixed data back to a new file if there were any fixes
-    if has_fixes:
-        with open(temp_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerows(fixed_rows)
-        
+    # Keep the fixed copy only if there were any fixes
+    if stats["fixed_errors"]:
+        os.replace(partial_filename, temp_filename)
         print(f"\nFixed CSV saved as: {temp_filename}")
         print(f"To replace the original file, rename {temp_filename} to {filename}")
     else:
+        os.remove(partial_filename)
         print("\nNo JSON errors were fixed.")
     
     # Print summary
     print("\n===== JSON Check Summary =====")
-    print(f"Total cells checked: {total_cells_checked}")
-    print(f"Total JSON cells found: {total_json_cells}")
-    print(f"Total errors found: {total_errors}")
-    print(f"Errors fixed: {fixed_errors}")
-    print(f"Errors not fixed: {unfixed_errors}")
-    print(f"Schema validation errors: {schema_errors}")
+    print(f"Total cells checked: {stats['cells_checked']}")
+    print(f"Total JSON cells found: {stats['json_cells']}")
+    print(f"Total errors found: {stats['errors']}")
+    print(f"Errors fixed: {stats['fixed_errors']}")
+    print(f"Errors not fixed: {stats['unfixed_errors']}")
+    print(f"Schema validation errors: {stats['schema_errors']}")
     
-    if error_types:
+    if stats["error_types"]:
         print("\nError types encountered:")
-        for error_type, count in error_types.items():
+        for error_type, count in stats["error_types"].items():
             print(f"  - {error_type}: {count} occurrences")
 
 def create_sample_schema():
@@ -277,6 +783,10 @@ if __name__ == "__main__":
                         help="Schema file for a specific column (can be used multiple times)")
     parser.add_argument("--create-sample-schema", action="store_true", help="Create a sample schema file")
     parser.add_argument("--summary-only", action="store_true", help="Show only summary statistics, not detailed logs")
+    parser.add_argument("--include-scalars", action="store_true",
+                        help="Also check cells that are not objects or arrays (numbers, strings, booleans) as JSON")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of worker processes to split the file between (default: 1)")
     
     args = parser.parse_args()
     
@@ -292,7 +802,8 @@ if __name__ == "__main__":
             for col_idx, schema_file in args.column_schema:
                 column_schemas[col_idx] = schema_file
         
-        check_and_fix_json_in_csv(args.csv_file, args.schema, column_schemas, args.summary_only)
+        check_and_fix_json_in_csv(args.csv_file, args.schema, column_schemas, args.summary_only,
+                                  args.include_scalars, args.jobs)
     else:
         parser.print_help()
 
@@ -0,0 +1,67 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import check
+
+
+class ParallelMatchesSerialTest(unittest.TestCase):
+    """
+    --jobs must give the same fixed CSV and log as a serial run, also when
+    quote characters in unquoted cells throw off the byte range boundaries
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        # Small ranges so the file is split many times
+        original_range = check.BYTES_PER_RANGE
+        check.BYTES_PER_RANGE = 200
+        self.addCleanup(setattr, check, "BYTES_PER_RANGE", original_range)
+
+    def run_check(self, filename, jobs):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            check.check_and_fix_json_in_csv(filename, jobs=jobs)
+        with open(filename + ".temp", 'rb') as f:
+            fixed = f.read()
+        os.remove(filename + ".temp")
+        return out.getvalue(), fixed
+
+    def assert_parallel_matches_serial(self, rows):
+        filename = os.path.join(self.tmpdir, "data.csv")
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            f.write("id,data,note\n")
+            f.writelines(rows)
+        serial = self.run_check(filename, 1)
+        self.assertEqual(self.run_check(filename, 3), serial)
+        self.assertEqual(os.listdir(self.tmpdir), ["data.csv"])
+
+    def test_odd_quote_in_unquoted_cell(self):
+        rows = []
+        for i in range(200):
+            if i == 50:
+                rows.append(f'{i},{{"a":"b}},x\n')
+            elif i % 5 == 0:
+                rows.append(f'{i},"{{""k"": {i},}}","line 1\nline 2"\n')
+            else:
+                rows.append(f'{i},"{{""k"": {i}}}",plain\n')
+        self.assert_parallel_matches_serial(rows)
+
+    def test_many_odd_quotes(self):
+        rows = []
+        for i in range(200):
+            if i % 9 == 0:
+                rows.append(f'{i},{{"a":"b}},x\n')
+            elif i % 4 == 0:
+                rows.append(f'{i},"{{\'k\': {i}}}","quote ""\n"\n')
+            else:
+                rows.append(f'{i},"{{""k"": {i},}}",plain\r\n')
+        self.assert_parallel_matches_serial(rows)
+
+
+if __name__ == "__main__":
+    unittest.main()